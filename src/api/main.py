@@ -4,7 +4,6 @@ import asyncio
 import os
 import shutil
 from contextlib import asynccontextmanager
-from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
@@ -16,9 +15,9 @@ from starlette.staticfiles import StaticFiles
 
 from src.api.middleware import JWTMiddleware
 from src.api.routes import router
+from src.api.routes.frontend import index_html_response
 from src.settings import (
     ADT_UTILS_DIR,
-    BASE_BRANCH_NAME,
     OUTPUT_DIR,
     STATE_CHECKPOINTS_DIR,
     custom_logger,
@@ -52,20 +51,13 @@ def create_app() -> FastAPI:
     async def lifespan(app: FastAPI):
         # Startup: initialize Git working branch if repo is present
         try:
-            from src.core.git_version_manager import AsyncGitVersionManager
+            from src.core.git_manager_provider import get_git_manager
 
             git_dir = os.path.join(OUTPUT_DIR, ".git")
             if os.path.isdir(git_dir):
-                manager = await AsyncGitVersionManager.create(
-                    repo_path=OUTPUT_DIR,
-                    base_branch_name=BASE_BRANCH_NAME,
-                    init_working_branch=True,
-                )
-                # Share the initialized manager with the rest of the app
-                from src.core.git_manager_provider import set_git_manager
-
-                set_git_manager(manager)
-                logger.info("Git manager initialization scheduled on startup")
+                # Created through the shared provider so every router uses it
+                if await get_git_manager(init_working_branch=True) is not None:
+                    logger.info("Git manager initialization scheduled on startup")
             else:
                 logger.debug(
                     f"Skipping Git manager initialization: no git repo at {OUTPUT_DIR}"
@@ -201,6 +193,24 @@ def create_app() -> FastAPI:
 
         yield
 
+        # Shutdown: persist checkpoints still queued for writing
+        try:
+            from src.api.routes.chat import state_checkpoint_manager
+
+            await state_checkpoint_manager.flush()
+        except Exception as e:
+            logger.error(f"Error flushing state checkpoints: {e}")
+
+        # Shutdown: close the Git manager's pooled GitHub connections
+        try:
+            from src.core.git_manager_provider import get_cached_git_manager
+
+            manager = get_cached_git_manager()
+            if manager is not None:
+                await manager.close()
+        except Exception as e:
+            logger.error(f"Error closing Git manager: {e}")
+
     app = FastAPI(
         title="ADT Chat Editor",
         description="API for the ADT Chat Editor service",
@@ -275,9 +285,9 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=404, detail="Not found")
 
         # Serve the React app for all other routes
-        index_file = Path("frontend/index.html")
-        if index_file.exists():
-            return FileResponse(index_file)
+        response = index_html_response(request)
+        if response is not None:
+            return response
 
         # Fallback if frontend index.html doesn't exist
         raise HTTPException(status_code=404, detail="Frontend not found")
@@ -176,7 +176,7 @@ async def run_script(request: RunScriptRequest):
 
         if result.returncode == 0:
             logger.info(f"Script {script_to_run.id} executed successfully")
-            return RunAllResponse(
+            return RunAllResponse.model_construct(
                 status="success",
                 message=f"Script {script_to_run.id} executed successfully",
                 output=result.stdout,
@@ -186,7 +186,7 @@ async def run_script(request: RunScriptRequest):
             logger.info(
                 f"Script {request.script_id} completed - found validation issues"
             )
-            return RunAllResponse(
+            return RunAllResponse.model_construct(
                 status="success",
                 message=f"Script {request.script_id} completed - found validation issues",
                 output=result.stdout,
@@ -206,7 +206,7 @@ async def run_script(request: RunScriptRequest):
             if result.stdout:
                 error_details += f"STDOUT: {result.stdout}"
 
-            return RunAllResponse(
+            return RunAllResponse.model_construct(
                 status="error",
                 message=f"Script {request.script_id} failed with return code {result.returncode}",
                 error=error_details,
@@ -3,13 +3,17 @@
 import os
 import sys
 
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from langchain_core.messages import AnyMessage
 
-from src.core.state_loader import StateCheckpointManager
+from src.core.state_loader import CHECKPOINT_FILENAME, StateCheckpointManager
 from src.settings import STATE_CHECKPOINTS_DIR, custom_logger
 from src.structs import ChatEditRequest, ChatEditResponse, ChatMessageResponse
-from src.utils.messages import message_is_agent, message_is_human
+from src.utils.messages import classify_message
 from src.workflows.graph import graph
+from src.workflows.state import ADTState
 
 sys.path.append(os.getcwd())
 
@@ -23,54 +27,132 @@ state_checkpoint_manager = StateCheckpointManager()
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
 
-# Define the endpoints
-@router.post("/edit", response_model=ChatEditResponse)
-async def chat_edit(request: ChatEditRequest) -> ChatEditResponse:
-    """Make changes on the current version of the ADT using natural language."""
+# Helpers shared by the endpoints
+async def _load_state(request: ChatEditRequest) -> tuple[ADTState, str]:
+    """Load (or create) the session's state checkpoint for a chat request.
+
+    Args:
+        request: The chat edit request.
+
+    Returns:
+        The state to run the graph on and the session's checkpoint path.
+    """
     request.language = request.language.lower().strip()
     logger.debug(
         f"Chat edit request: session_id={request.session_id}, language={request.language}"
     )
-    logger.debug(f"Listdir: {os.listdir(STATE_CHECKPOINTS_DIR)}")
 
-    # Get project root directory
-    checkpoint_path = os.path.join(STATE_CHECKPOINTS_DIR, request.session_id)
+    # Resolve the checkpoint location once for both the load and the save
+    session_dir = os.path.join(STATE_CHECKPOINTS_DIR, request.session_id)
+    checkpoint_path = os.path.join(session_dir, CHECKPOINT_FILENAME)
     logger.debug(f"Checkpoint path: {checkpoint_path}")
 
-    if os.path.exists(checkpoint_path):
-        state_checkpoint = state_checkpoint_manager.load_state_checkpoint(
-            request, path=os.path.join(checkpoint_path, "checkpoint.json")
+    # Make sure a previous turn's queued checkpoint is on disk before loading
+    await state_checkpoint_manager.flush(request.session_id)
+    try:
+        state_checkpoint = await state_checkpoint_manager.aload_state_checkpoint(
+            request, path=checkpoint_path
         )
-        logger.debug(f"Loaded state checkpoint: {state_checkpoint}")
-    else:
+        logger.debug(
+            f"Loaded state checkpoint with {len(state_checkpoint.messages)} messages"
+        )
+    except FileNotFoundError:
         state_checkpoint = state_checkpoint_manager.create_new_state_checkpoint(
-            request, path=checkpoint_path
+            request, path=session_dir
         )
-        logger.debug(f"Created new state checkpoint: {state_checkpoint}")
+        logger.debug("Created new state checkpoint")
 
-    logger.debug(f"Invoking graph with state: {state_checkpoint}")
-    output = await graph.ainvoke(state_checkpoint)
+    return state_checkpoint, checkpoint_path
 
-    # Format messages
-    messages = [
-        ChatMessageResponse(
+
+def _format_messages(
+    messages: list[AnyMessage], start: int = 0
+) -> list[ChatMessageResponse]:
+    """Format graph messages for the response, numbered from `start`."""
+    # Built from trusted graph output, so skip re-validation; FastAPI still
+    # validates once through `response_model`
+    return [
+        ChatMessageResponse.model_construct(
             message_number=k,
             content=message.content,
-            is_agent=message_is_agent(message),
-            show=message_is_human(message),
+            is_agent=is_agent,
+            show=show,
         )
-        for k, message in enumerate(output["messages"])
+        for k, message in enumerate(messages[start:], start)
+        for is_agent, show in (classify_message(message),)
     ]
 
+
+# Define the endpoints
+@router.post("/edit", response_model=ChatEditResponse)
+async def chat_edit(request: ChatEditRequest) -> ChatEditResponse:
+    """Make changes on the current version of the ADT using natural language."""
+    state_checkpoint, checkpoint_path = await _load_state(request)
+
+    logger.debug(f"Invoking graph for session {request.session_id}")
+    output = await graph.ainvoke(state_checkpoint)
+
     # Create response
-    response = ChatEditResponse(
+    response = ChatEditResponse.model_construct(
         session_id=request.session_id,
         status=output["status"],
-        messages=messages,
+        messages=_format_messages(output["messages"]),
         book_information=request.book_information,
     )
 
-    # Save state checkpoint
-    state_checkpoint_manager.save_state_checkpoint(request, output)
+    # Queue the state checkpoint so the disk write stays off the response path
+    state_checkpoint_manager.enqueue_state_checkpoint(
+        request, output, path=checkpoint_path
+    )
 
     return response
+
+
+@router.post("/edit/stream")
+async def chat_edit_stream(request: ChatEditRequest) -> StreamingResponse:
+    """Run the chat edit workflow like `/edit`, streaming progress as NDJSON.
+
+    Every graph step produces an `update` line with the workflow status and
+    the messages added since the previous line. The last line is a `done`
+    event carrying the full `ChatEditResponse`.
+    """
+    state_checkpoint, checkpoint_path = await _load_state(request)
+
+    async def stream():
+        logger.debug(f"Streaming graph for session {request.session_id}")
+        output = None
+        sent = 0
+        async for output in graph.astream(state_checkpoint, stream_mode="values"):
+            messages = output.get("messages", [])
+            yield orjson.dumps(
+                {
+                    "event": "update",
+                    "status": output.get("status"),
+                    "messages": [
+                        message.model_dump(mode="json")
+                        for message in _format_messages(messages, sent)
+                    ],
+                }
+            ) + b"\n"
+            sent = len(messages)
+
+        if output is None:
+            return
+
+        # Only checkpoint complete runs, not ones cut off by a disconnect, and
+        # queue it before reporting success in case the client leaves now
+        state_checkpoint_manager.enqueue_state_checkpoint(
+            request, output, path=checkpoint_path
+        )
+
+        response = ChatEditResponse.model_construct(
+            session_id=request.session_id,
+            status=output["status"],
+            messages=_format_messages(output["messages"]),
+            book_information=request.book_information,
+        )
+        yield orjson.dumps(
+            {"event": "done", **response.model_dump(mode="json")}
+        ) + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
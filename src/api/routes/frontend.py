@@ -1,9 +1,11 @@
 """Frontend static file serving endpoints."""
 
+import hashlib
 from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response
 
 from src.settings import custom_logger
 
@@ -15,11 +17,54 @@ router = APIRouter(
     tags=["Frontend"],
 )
 
+INDEX_FILE = Path("frontend/index.html")
+
+# index.html bytes and ETag, read on first use
+_index_html: Optional[tuple[bytes, str]] = None
+
+
+def _load_index_html() -> Optional[tuple[bytes, str]]:
+    """Return the cached frontend index.html and its ETag.
+
+    The file is only read once; until it exists, every call checks again so
+    a frontend built after startup is still picked up.
+
+    Returns:
+        The file contents and ETag, or None if the file does not exist.
+    """
+    global _index_html
+    if _index_html is None and INDEX_FILE.exists():
+        content = INDEX_FILE.read_bytes()
+        etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        _index_html = (content, etag)
+        logger.debug(f"Cached {INDEX_FILE} ({len(content)} bytes)")
+    return _index_html
+
+
+def index_html_response(request: Request) -> Optional[Response]:
+    """Build the response serving the frontend's index.html.
+
+    Args:
+        request: The incoming request, checked for a matching `If-None-Match`.
+
+    Returns:
+        The HTML response (or a 304 if the client copy is current), or None if
+        the file does not exist.
+    """
+    index_html = _load_index_html()
+    if index_html is None:
+        return None
+    content, etag = index_html
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content, headers=headers)
+
 
 @router.get("/", response_class=HTMLResponse)
-async def read_root():
+async def read_root(request: Request):
     """Serve the frontend's index.html file."""
-    index_file = Path("frontend/index.html")
-    if index_file.exists():
-        return FileResponse(index_file)
+    response = index_html_response(request)
+    if response is not None:
+        return response
     raise HTTPException(status_code=404, detail="index.html not found")
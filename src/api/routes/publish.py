@@ -1,10 +1,12 @@
 """Endpoints to commit, push and publish changes via Git/GitHub."""
 
+import asyncio
 from typing import Dict, List
 
 from fastapi import APIRouter, Body
 
 from src.core.git_manager_provider import get_git_manager
+from src.core.git_version_manager import AsyncGitVersionManager
 from src.settings import custom_logger
 from src.structs import PublishMetadata, PublishRequest, PublishResponse
 
@@ -82,6 +84,61 @@ async def checkout_commit(commit: Dict[str, str] = Body(...)):
         return {"status": "error", "detail": str(e)}
 
 
+async def _push_tag_and_pr(
+    git_manager: AsyncGitVersionManager,
+    branch_name: str,
+    checked_out_branch: str,
+    message: str,
+) -> None:
+    """Push the branch, tag it as last published and make sure a PR is open.
+
+    Args:
+        git_manager: The shared Git manager.
+        branch_name: The working branch to publish.
+        checked_out_branch: What is checked out ('HEAD' if detached).
+        message: The publish message, used for the PR title and body.
+    """
+    # Whether a PR is open only depends on the branch name, so check it while
+    # the push runs. The push is awaited first so its outcome is never lost to
+    # a failing check, and the tag only moves once the push has landed, or a
+    # failed push would leave nothing to publish on retry.
+    pr_check = asyncio.create_task(
+        git_manager.pull_request_exists(branch_name=branch_name)
+    )
+    try:
+        await git_manager.safe_push(
+            branch_name=branch_name, current_branch=checked_out_branch
+        )
+    except BaseException:
+        if not pr_check.cancel() and not pr_check.cancelled():
+            # Already finished; retrieve its outcome so it is not reported
+            pr_check.exception()
+        raise
+    logger.debug(f"Pushed branch '{branch_name}' to origin")
+    await git_manager.tag_last_published_commit()
+    logger.debug("Tagged last published commit")
+
+    pr_exists = await pr_check
+
+    if not pr_exists:
+        pr_url = await git_manager.create_pull_request(
+            title=f"ADT-chat-editor: {message}",
+            body=message,
+            base="main",
+            head=branch_name,
+        )
+        logger.debug(f"Created new PR: {pr_url}")
+    else:
+        logger.debug(f"PR already exists for branch '{branch_name}'")
+
+    # Create an empty baseline commit so future edits aren't treated as the first commit
+    try:
+        await git_manager.first_commit("First commit")
+        logger.debug("Created baseline empty commit after publish")
+    except Exception as e:
+        logger.debug(f"Unable to create baseline empty commit: {e}")
+
+
 @router.post("", response_model=PublishResponse)
 async def publish_changes(request: PublishRequest):
     """Commit changes if any, push branch, tag last published, and open PR."""
@@ -100,9 +157,15 @@ async def publish_changes(request: PublishRequest):
         current_branch = await git_manager.current_branch()
         logger.debug(f"Current working branch: {current_branch}")
 
-        previous_commits = await git_manager.list_commits(branch_name=current_branch)
-        current_commit = await git_manager.commit_changes(message=message)
+        # The log is only used when nothing new gets committed, so it can be
+        # read while the commit runs
+        previous_commits, current_commit = await asyncio.gather(
+            git_manager.list_commits(branch_name=current_branch),
+            git_manager.commit_changes(message=message),
+        )
 
+        # Keep what is checked out so helpers don't have to query it again
+        checked_out_branch = current_branch
         if current_branch == "HEAD":
             # Use the working-branch determined at startup
             current_branch = getattr(git_manager, "true_branch_name", None)
@@ -114,63 +177,13 @@ async def publish_changes(request: PublishRequest):
                     metadata=PublishMetadata(id=book_information.id, title=message, changes=[]),
                 )
         
-        if current_commit:
-            logger.debug(f"Committed changes with message: {message}")
-
-            await git_manager.safe_push(branch_name=current_branch)
-            logger.debug(f"Pushed branch '{current_branch}' to origin")
-
-            await git_manager.tag_last_published_commit()
-            logger.debug("Tagged last published commit")
+        if current_commit or previous_commits:
+            if current_commit:
+                logger.debug(f"Committed changes with message: {message}")
 
-            pr_exists = await git_manager.pull_request_exists(branch_name=current_branch)
-            if not pr_exists:
-                pr_url = await git_manager.create_pull_request(
-                    title=f"ADT-chat-editor: {message}",
-                    body=message,
-                    base="main"
-                )
-                logger.debug(f"Created new PR: {pr_url}")                
-            else:
-                logger.debug(f"PR already exists for branch '{current_branch}'")
-
-            # Create an empty baseline commit so future edits aren't treated as the first commit
-            try:
-                await git_manager.first_commit("First commit")
-                logger.debug("Created baseline empty commit after publish")
-            except Exception as e:
-                logger.debug(f"Unable to create baseline empty commit: {e}")
-
-            return PublishResponse(
-                status="published",
-                metadata=PublishMetadata(id=book_information.id, title=message, changes=[]),
+            await _push_tag_and_pr(
+                git_manager, current_branch, checked_out_branch, message
             )
-
-        elif previous_commits:
-            await git_manager.safe_push(branch_name=current_branch)
-            logger.debug(f"Pushed branch '{current_branch}' to origin")
-
-            await git_manager.tag_last_published_commit()
-            logger.debug("Tagged last published commit")
-
-            pr_exists = await git_manager.pull_request_exists(branch_name=current_branch)
-            if not pr_exists:
-                pr_url = await git_manager.create_pull_request(
-                    title=f"ADT-chat-editor: {message}",
-                    body=message,
-                    base="main"
-                )
-                logger.debug(f"Created new PR: {pr_url}")                
-            else:
-                logger.debug(f"PR already exists for branch '{current_branch}'")
-
-            # Create an empty baseline commit so future edits aren't treated as the first commit
-            try:
-                await git_manager.first_commit("First commit")
-                logger.debug("Created baseline empty commit after publish")
-            except Exception as e:
-                logger.debug(f"Unable to create baseline empty commit: {e}")
-
             return PublishResponse(
                 status="published",
                 metadata=PublishMetadata(id=book_information.id, title=message, changes=[]),
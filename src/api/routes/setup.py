@@ -1,11 +1,13 @@
 """Setup endpoints to initialize languages, Tailwind, and caches."""
 
+import asyncio
 import os
-import subprocess
-from typing import Dict
+import time
+from typing import Dict, Optional
 
 from fastapi import APIRouter, HTTPException
 
+from src.structs import TranslatedHTMLStatus
 from src.utils.initialization import (
     initialize_languages,
     initialize_tailwind,
@@ -16,6 +18,27 @@ from src.workflows.actions import _format_html_files
 # Setup router
 router = APIRouter(prefix="/setup", tags=["setup"])
 
+NPM_PROJECT_DIR = "/app/data/output"
+
+# Upper bound on languages whose HTML contents are extracted concurrently
+MAX_CONCURRENT_LANGUAGES = 8
+
+# Only one `npm list` at a time, however often the status is polled
+_npm_status_lock = asyncio.Lock()
+
+# Last npm status, reused while node_modules is untouched and still fresh
+NPM_STATUS_TTL_SECONDS = 30
+_npm_cache: Dict[str, Optional[float] | Dict[str, str]] = {
+    "mtime": None,
+    "status": None,
+    "ts": 0.0,
+}
+
+
+def _invalidate_npm_status() -> None:
+    """Drop the cached npm status so the next poll runs `npm list` again."""
+    _npm_cache.update(mtime=None, status=None, ts=0.0)
+
 
 # Endpoints
 @router.post("/initialize")
@@ -27,12 +50,27 @@ async def install_npm_packages() -> Dict[str, str | list[str]]:
 
         # Initialize tailwind
         tailwind_status = await initialize_tailwind()
+        _invalidate_npm_status()
+
+        # Initialize translated HTML contents (languages are independent)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LANGUAGES)
 
-        # Initialize translated HTML contents
-        translated_html_statuses = []
-        for language in languages:
-            translated_html_status = await initialize_translated_html_content(language)
-            translated_html_statuses.append(translated_html_status.value)
+        async def initialize_language(language: str) -> TranslatedHTMLStatus:
+            async with semaphore:
+                return await initialize_translated_html_content(language)
+
+        results = await asyncio.gather(
+            *(initialize_language(language) for language in languages),
+            return_exceptions=True,
+        )
+        translated_html_statuses = [
+            (
+                TranslatedHTMLStatus.FAILED.value
+                if isinstance(result, BaseException)
+                else result.value
+            )
+            for result in results
+        ]
 
         # Format HTML files with prettier
         # await _format_html_files([], all_files=True)
@@ -54,27 +92,43 @@ async def check_npm_status() -> Dict[str, str]:
     """Check the status of npm packages in the /app/data/output directory."""
     try:
         # Check if node_modules exists
-        if not os.path.exists("/app/data/output/node_modules"):
+        try:
+            mtime = os.stat(os.path.join(NPM_PROJECT_DIR, "node_modules")).st_mtime
+        except FileNotFoundError:
             return {
                 "status": "not_installed",
                 "message": "node_modules directory not found",
             }
 
-        # Run npm list to check installed packages
-        result = subprocess.run(
-            "cd /app/data/output && npm list --json",
-            shell=True,
-            capture_output=True,
-            text=True,
-        )
+        async with _npm_status_lock:
+            # Callers that waited on the lock reuse the result just computed
+            if (
+                _npm_cache["status"] is not None
+                and _npm_cache["mtime"] == mtime
+                and time.monotonic() - _npm_cache["ts"] < NPM_STATUS_TTL_SECONDS
+            ):
+                return _npm_cache["status"]
 
-        if result.returncode == 0:
-            return {"status": "installed", "message": "npm packages are installed"}
-        else:
-            return {
-                "status": "error",
-                "message": f"Error checking npm packages: {result.stderr}",
-            }
+            # Run npm list to check installed packages
+            process = await asyncio.create_subprocess_exec(
+                "npm",
+                "list",
+                "--json",
+                cwd=NPM_PROJECT_DIR,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+
+            if process.returncode == 0:
+                status = {"status": "installed", "message": "npm packages are installed"}
+            else:
+                status = {
+                    "status": "error",
+                    "message": f"Error checking npm packages: {stderr.decode()}",
+                }
+            _npm_cache.update(mtime=mtime, status=status, ts=time.monotonic())
+            return status
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to check npm status: {str(e)}"
@@ -21,7 +21,7 @@ _terminal_service = TerminalService()
 async def execute_command(request: ExecuteCommandRequest):
     """Execute a command in the backend container."""
     try:
-        return _terminal_service.execute_command(request)
+        return await _terminal_service.execute_command_async(request)
     except ValueError as e:
         logger.info(f"Error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -16,13 +16,19 @@ import sys
 from pathlib import Path
 
 
+def _emit(payload: dict) -> None:
+    """Stream the JSON payload to stdout without building the string first."""
+    json.dump(payload, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
 def main() -> int:
     """Entry point for the fixer runner.
 
     Returns a JSON payload on stdout so the parent process can parse results.
     """
     if len(sys.argv) < 3:
-        sys.stdout.write(json.dumps({"success": False, "error": "missing arguments"}))
+        _emit({"success": False, "error": "missing arguments"})
         return 2
 
     target_dir = Path(sys.argv[1])
@@ -35,7 +41,7 @@ def main() -> int:
         from src.core import PageProcessConfig  # type: ignore
         from src.validation.classes import ADTDataFixer  # type: ignore
     except Exception as e:  # pragma: no cover - depends on runtime env
-        sys.stdout.write(json.dumps({"success": False, "error": f"import_error: {e}"}))
+        _emit({"success": False, "error": f"import_error: {e}"})
         return 1
 
     try:
@@ -46,10 +52,10 @@ def main() -> int:
         )
         fixer = ADTDataFixer()
         result = fixer.process_page_range(fix_config, dry_run=False, auto_format=False)
-        sys.stdout.write(json.dumps({"success": result.success, "metadata": result.metadata}))
+        _emit({"success": result.success, "metadata": result.metadata})
         return 0
     except Exception as e:  # pragma: no cover - external deps
-        sys.stdout.write(json.dumps({"success": False, "error": f"fix_error: {e}"}))
+        _emit({"success": False, "error": f"fix_error: {e}"})
         return 1
 
 
@@ -1,5 +1,6 @@
 """Provide a lazily created shared Git manager instance."""
 
+import asyncio
 from typing import Optional
 
 from src.core.git_version_manager import AsyncGitVersionManager
@@ -8,25 +9,36 @@ from src.settings import BASE_BRANCH_NAME, OUTPUT_DIR, custom_logger
 logger = custom_logger("GitManagerProvider")
 
 _git_manager: Optional[AsyncGitVersionManager] = None
+# Serialises the first creation so concurrent requests share one setup
+_git_manager_lock = asyncio.Lock()
 
 
-async def get_git_manager() -> Optional[AsyncGitVersionManager]:
+async def get_git_manager(
+    init_working_branch: bool = False,
+) -> Optional[AsyncGitVersionManager]:
     """Lazily create and cache a Git manager (async setup).
 
     Returns None if initialisation fails (e.g., OUTPUT_DIR not a git repo),
     so callers can gracefully degrade in dev/test environments.
+
+    Args:
+        init_working_branch: Select or create the working branch when the
+            manager is created here (app startup does this once).
     """
     global _git_manager
-    if _git_manager is None:
-        try:
-            _git_manager = await AsyncGitVersionManager.create(
-                repo_path=OUTPUT_DIR,
-                base_branch_name=BASE_BRANCH_NAME,
-                init_working_branch=False,
-            )
-        except Exception as e:  # pragma: no cover - environment dependent
-            logger.debug(f"Git manager unavailable: {e}")
-            _git_manager = None
+    if _git_manager is not None:
+        return _git_manager
+    async with _git_manager_lock:
+        if _git_manager is None:
+            try:
+                _git_manager = await AsyncGitVersionManager.create(
+                    repo_path=OUTPUT_DIR,
+                    base_branch_name=BASE_BRANCH_NAME,
+                    init_working_branch=init_working_branch,
+                )
+            except Exception as e:  # pragma: no cover - environment dependent
+                logger.debug(f"Git manager unavailable: {e}")
+                _git_manager = None
     return _git_manager
 
 def get_cached_git_manager() -> Optional[AsyncGitVersionManager]:
@@ -3,10 +3,18 @@
 This module handles persistence of the agentic workflow state across requests.
 """
 
-import json
+import asyncio
+import hashlib
+import mmap
 import os
-from ast import literal_eval
+import struct
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterator, Optional, Union
 
+import msgspec
+import zstandard
 from langchain_core.messages import (
     AIMessage,
     AnyMessage,
@@ -14,6 +22,7 @@ from langchain_core.messages import (
     HumanMessage,
     SystemMessage,
 )
+from pydantic import TypeAdapter
 
 from src.settings import STATE_CHECKPOINTS_DIR, custom_logger
 from src.structs import (
@@ -25,14 +34,94 @@ from src.structs import (
 )
 from src.workflows.state import ADTState
 
+# Checkpoints are only read back by this service, so they are stored as
+# MessagePack. The checkpoints directory is wiped on startup, so no older
+# (JSON) checkpoint ever needs to be read.
+# Each turn appends a frame with the new messages to the journal, and the full
+# state is snapshotted every SNAPSHOT_INTERVAL turns.
+CHECKPOINT_FILENAME = "checkpoint.msgpack"
+JOURNAL_FILENAME = "checkpoint.journal"
+SNAPSHOT_INTERVAL = 20
+# Checkpoint files at least this large are memory-mapped for decoding
+MMAP_THRESHOLD = 1024 * 1024
+# Snapshots and journal frames at least this large are zstd-compressed; the
+# HTML pages in the state compress several times over
+COMPRESSION_THRESHOLD = 16 * 1024
+COMPRESSION_LEVEL = 3
+
+_SNAPSHOT = "snapshot"
+_JOURNAL = "journal"
+
+_CHECKPOINT_ENCODER = msgspec.msgpack.Encoder()
+# msgspec caches short dict keys while decoding, so the repeated
+# "type"/"content" keys of every message share one str object without
+# manual interning
+_CHECKPOINT_DECODER = msgspec.msgpack.Decoder(dict)
+# Compressed payloads are told apart by the zstd frame magic, which can never
+# start a MessagePack map
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Journal frames are length-prefixed, MessagePack has no record separator
+_FRAME_HEADER = struct.Struct(">I")
+# Most buffers a single writev call accepts
+_IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16) if hasattr(os, "sysconf") else 16
+
+# Fields reset from the request on every load, so not worth persisting;
+# messages are serialized separately
+_UNPERSISTED_FIELDS = {
+    "messages",
+    "user_query",
+    "session_id",
+    "status",
+    "current_step_index",
+    "plan_accepted",
+    "current_pages",
+}
+
+# Checkpoints are written by this service, so loads skip full validation and
+# only convert the stored fields whose runtime type is not a plain value
+_TYPED_FIELDS = {
+    name: TypeAdapter(ADTState.model_fields[name].annotation)
+    for name in (
+        "steps",
+        "completed_steps",
+        "tailwind_status",
+        "translated_html_status",
+        "user_language",
+    )
+}
+
+_MSG_TYPES = {
+    "human": HumanMessage,
+    "ai": AIMessage,
+    "system": SystemMessage,
+}
+_MSG_TYPE_NAMES = {cls: name for name, cls in _MSG_TYPES.items()}
+
 
 class StateCheckpointManager:
     """Load and save state checkpoints for a given session ID."""
 
-    def __init__(self):
-        """Initialize the checkpoint manager and ensure storage directory exists."""
+    def __init__(self, validate_on_load: bool = False):
+        """Initialize the checkpoint manager and ensure storage directory exists.
+
+        Args:
+            validate_on_load: Fully validate loaded checkpoints, for debugging.
+        """
         self.logger = custom_logger(self.__class__.__name__)
+        self.validate_on_load = validate_on_load
         os.makedirs(STATE_CHECKPOINTS_DIR, exist_ok=True)
+        # Resolved once; the working directory does not change at runtime
+        self._checkpoints_root = os.path.join(os.getcwd(), STATE_CHECKPOINTS_DIR)
+
+        # Write-behind queue: (checkpoint path, workflow output) per session
+        # and the task currently draining them
+        self._pending: dict[str, list[tuple[str, dict]]] = {}
+        self._flush_tasks: dict[str, asyncio.Task] = {}
+
+        # Journal bookkeeping per session: last turn written, number of
+        # persisted messages, journal frames since the last snapshot and the
+        # digest of the last written state fields
+        self._journals: dict[str, dict] = {}
 
     def create_new_state_checkpoint(
         self, request: ChatEditRequest, path: str
@@ -47,6 +136,8 @@ class StateCheckpointManager:
         """
         # Create directory if it doesn't exist
         os.makedirs(path, exist_ok=True)
+        # Start over with a full snapshot on the next save
+        self._journals.pop(request.session_id, None)
 
         # Create new state checkpoint
         state_checkpoint = ADTState(
@@ -78,46 +169,37 @@ class StateCheckpointManager:
             The state checkpoint for the given session ID.
         """
         try:
-            with open(path, encoding="utf-8") as f:
+            try:
+                state_dict = self._read_checkpoint(request.session_id, path)
+            except msgspec.DecodeError as e:
+                self.logger.error(f"Error decoding checkpoint from {path}: {e}")
+                raise
+
+            # Update messages and required fields
+            state_dict["messages"] = self._deserialize_messages(
+                state_dict.get("messages", [])
+            ) + [HumanMessage(content=request.user_message)]
+
+            state_dict["user_query"] = request.user_message
+            state_dict["session_id"] = request.session_id
+            state_dict["current_step_index"] = -1
+            state_dict["plan_accepted"] = False
+            state_dict["status"] = WorkflowStatus.IN_PROGRESS
+            state_dict["current_pages"] = request.pages
+            if request.language:
+                state_dict["language"] = request.language
+            if request.user_language:
                 try:
-                    raw = json.load(f)
-                    # Backward compatibility: older versions stored a JSON string in JSON.
-                    if isinstance(raw, str):
-                        try:
-                            state_dict = json.loads(raw)
-                        except json.JSONDecodeError:
-                            # Last resort: evaluate Python-literal-like strings
-                            state_dict = literal_eval(raw)
-                    else:
-                        state_dict = raw
-
-                    self.logger.debug(f"Loaded state dict: {state_dict}")
-
-                    # Update messages and required fields
-                    state_dict["messages"] = self._deserialize_messages(
-                        state_dict.get("messages", [])
-                    ) + [HumanMessage(content=request.user_message)]
-
-                    state_dict["user_query"] = request.user_message
-                    state_dict["session_id"] = request.session_id
-                    state_dict["current_step_index"] = -1
-                    state_dict["plan_accepted"] = False
-                    state_dict["status"] = WorkflowStatus.IN_PROGRESS
-                    state_dict["current_pages"] = request.pages
-                    if request.language:
-                        state_dict["language"] = request.language
-                    if request.user_language:
-                        try:
-                            state_dict["user_language"] = UserLanguage(request.user_language.lower())
-                        except ValueError:
-                            state_dict["user_language"] = UserLanguage.en
-
-                    state_checkpoint = ADTState(**state_dict)
-                    self.logger.debug(f"Loading state checkpoint: {state_checkpoint}")
-                    return state_checkpoint
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"Error decoding JSON from {path}: {e}")
-                    raise
+                    state_dict["user_language"] = UserLanguage(request.user_language.lower())
+                except ValueError:
+                    state_dict["user_language"] = UserLanguage.en
+
+            if self.validate_on_load:
+                return ADTState(**state_dict)
+            for name, adapter in _TYPED_FIELDS.items():
+                if name in state_dict:
+                    state_dict[name] = adapter.validate_python(state_dict[name])
+            return ADTState.model_construct(**state_dict)
         except FileNotFoundError:
             self.logger.info(f"No checkpoint found for session {request.session_id}")
             raise FileNotFoundError(
@@ -127,40 +209,460 @@ class StateCheckpointManager:
             self.logger.error(f"Unexpected error loading checkpoint: {e}")
             raise Exception(f"Unexpected error loading checkpoint: {e}")
 
-    def save_state_checkpoint(self, request: ChatEditRequest, output: dict):
+    async def aload_state_checkpoint(
+        self, request: ChatEditRequest, path: str
+    ) -> ADTState:
+        """Load the state checkpoint in a worker thread.
+
+        Same as `load_state_checkpoint`, but keeps the file read and decoding
+        off the event loop.
+
+        Args:
+            request: The request object containing the session ID and user message.
+            path: The path to the checkpoint file.
+
+        Returns:
+            The state checkpoint for the given session ID.
+        """
+        return await asyncio.to_thread(self.load_state_checkpoint, request, path)
+
+    def save_state_checkpoint(
+        self, request: ChatEditRequest, output: dict, path: Optional[str] = None
+    ):
         """Save the state checkpoint for a given session ID.
 
         Args:
             request: The request object containing the session ID and user message.
             output: The output of the workflow.
+            path: The path to the checkpoint file. Defaults to the session's
+                checkpoint under `STATE_CHECKPOINTS_DIR`.
+        """
+        session_id = request.session_id
+        checkpoint_path = path or self._checkpoint_path(session_id)
+        encoded = self._encode_checkpoint(session_id, output)
+        if encoded is None:
+            return
+        kind, payload = encoded
+        try:
+            self._apply_writes([(kind, checkpoint_path, payload)])
+        except Exception:
+            self._journals.pop(session_id, None)
+            raise
+
+    async def asave_state_checkpoint(
+        self, request: ChatEditRequest, output: dict, path: Optional[str] = None
+    ) -> None:
+        """Save the state checkpoint in a worker thread.
+
+        Same as `save_state_checkpoint`, but keeps encoding and the file write
+        off the event loop. Use `enqueue_state_checkpoint` instead when the
+        caller does not need to wait for the write.
+
+        Args:
+            request: The request object containing the session ID and user message.
+            output: The output of the workflow.
+            path: The path to the checkpoint file. Defaults to the session's
+                checkpoint under `STATE_CHECKPOINTS_DIR`.
+        """
+        await asyncio.to_thread(self.save_state_checkpoint, request, output, path)
+
+    def enqueue_state_checkpoint(
+        self, request: ChatEditRequest, output: dict, path: Optional[str] = None
+    ) -> None:
+        """Queue the state checkpoint to be written in the background.
+
+        Encoding and writing both happen in a worker thread, so the event loop
+        only records the output. Writes are batched per session: journal
+        frames queued while an older write is in flight are appended
+        together, and a snapshot supersedes everything queued before it.
+        Must be called from within the running event loop.
+
+        Args:
+            request: The request object containing the session ID and user message.
+            output: The output of the workflow.
+            path: The path to the checkpoint file. Defaults to the session's
+                checkpoint under `STATE_CHECKPOINTS_DIR`.
+        """
+        session_id = request.session_id
+        checkpoint_path = path or self._checkpoint_path(session_id)
+        self._pending.setdefault(session_id, []).append((checkpoint_path, output))
+
+        if session_id not in self._flush_tasks:
+            self._flush_tasks[session_id] = asyncio.create_task(
+                self._flush_session(session_id)
+            )
+
+    async def flush(self, session_id: Optional[str] = None) -> None:
+        """Wait until queued checkpoint writes have reached the disk.
+
+        Args:
+            session_id: Only wait for this session. Waits for all sessions if None.
+        """
+        if session_id is None:
+            tasks = list(self._flush_tasks.values())
+        else:
+            task = self._flush_tasks.get(session_id)
+            tasks = [task] if task else []
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _flush_session(self, session_id: str) -> None:
+        """Write the pending checkpoints of a session until none are left."""
+        try:
+            while session_id in self._pending:
+                queued = self._pending.pop(session_id)
+                try:
+                    await asyncio.to_thread(self._write_queued, session_id, queued)
+                except Exception as e:
+                    self.logger.error(
+                        f"Error writing queued checkpoints for {session_id}: {e}"
+                    )
+                    # Frames may be missing on disk, so the next save writes
+                    # a full snapshot
+                    self._journals.pop(session_id, None)
+        finally:
+            self._flush_tasks.pop(session_id, None)
+
+    def _write_queued(self, session_id: str, queued: list[tuple[str, dict]]) -> None:
+        """Encode queued workflow outputs in order and write the result.
+
+        Args:
+            session_id: The session the checkpoints belong to.
+            queued: The (checkpoint path, workflow output) pairs, oldest first.
+        """
+        writes = []
+        for checkpoint_path, output in queued:
+            encoded = self._encode_checkpoint(session_id, output)
+            if encoded is None:
+                continue
+            kind, payload = encoded
+            if kind == _SNAPSHOT:
+                # Nothing queued before a snapshot needs to reach the disk
+                writes.clear()
+            writes.append((kind, checkpoint_path, payload))
+        self._apply_writes(writes)
+
+    def _encode_checkpoint(
+        self, session_id: str, output: dict
+    ) -> Optional[tuple[str, bytes]]:
+        """Serialize the workflow output into a snapshot or a journal frame.
+
+        Only messages added since the last write go into a journal frame,
+        along with the state fields unless they are unchanged. A
+        full snapshot is written for the first save of a session, every
+        `SNAPSHOT_INTERVAL` frames, and whenever the history was not simply
+        appended to. Nothing is written when the state did not change.
+
+        Args:
+            session_id: The session the checkpoint belongs to.
+            output: The output of the workflow.
+
+        Returns:
+            The kind of write (snapshot or journal) and the encoded bytes, or
+            None if the state is unchanged since the last write.
         """
-        # Convert output to dict
-        output["user_query"] = output["user_query"][0].content
-        output: ADTState = ADTState(**output)
-        self.logger.debug(f"Output: {output}")
-
-        # Convert to dictionary (not nested JSON string)
-        state_dict = output.model_dump(mode="json", serialize_as_any=True)
-        # Ensure messages are stored in a simple JSON-serializable format
-        state_dict["messages"] = self._serialize_messages(list(output.messages))
-        self.logger.debug(f"State dict keys: {list(state_dict.keys())}")
-
-        # Save state checkpoint
-        checkpoint_path = os.path.join(
-            os.getcwd(),
-            STATE_CHECKPOINTS_DIR,
-            request.session_id,
-            "checkpoint.json",
+        # The graph output is already typed, so wrap it without re-validating
+        # and only dump the fields that survive a reload
+        state = ADTState.model_construct(**output)
+        state_dict = state.model_dump(
+            mode="json", serialize_as_any=True, exclude=_UNPERSISTED_FIELDS
         )
-        self.logger.debug(f"Saving checkpoint to: {checkpoint_path}")
+        messages = list(state.messages)
+        self.logger.debug("State dict keys: %s", list(state_dict))
+
+        digest = hashlib.blake2b(
+            _CHECKPOINT_ENCODER.encode(state_dict), digest_size=16
+        ).digest()
+        journal = self._journals.get(session_id)
+        if (
+            journal is not None
+            and len(messages) == journal["messages"]
+            and digest == journal["digest"]
+        ):
+            self.logger.debug("Checkpoint unchanged for session %s", session_id)
+            return None
+
+        turn = journal["turn"] + 1 if journal else 1
+        state_dict["checkpoint_turn"] = turn
+
+        if (
+            journal is None
+            or journal["entries"] >= SNAPSHOT_INTERVAL
+            or len(messages) < journal["messages"]
+        ):
+            state_dict["messages"] = self._serialize_messages(messages)
+            self._journals[session_id] = {
+                "turn": turn,
+                "messages": len(messages),
+                "entries": 0,
+                "digest": digest,
+            }
+            return _SNAPSHOT, self._compress(_CHECKPOINT_ENCODER.encode(state_dict))
+
+        offset = journal["messages"]
+        if digest == journal["digest"]:
+            # Only the history grew; replay keeps the earlier state fields
+            state_dict = {"checkpoint_turn": turn}
+        state_dict["message_offset"] = offset
+        state_dict["messages"] = self._serialize_messages(messages[offset:])
+        self._journals[session_id] = {
+            "turn": turn,
+            "messages": len(messages),
+            "entries": journal["entries"] + 1,
+            "digest": digest,
+        }
+        frame = self._compress(_CHECKPOINT_ENCODER.encode(state_dict))
+        return _JOURNAL, _FRAME_HEADER.pack(len(frame)) + frame
+
+    def _apply_writes(self, writes: list[tuple[str, str, bytes]]) -> None:
+        """Write queued snapshots and journal frames in order.
+
+        Consecutive journal frames for the same checkpoint are appended with a
+        single write.
+
+        Args:
+            writes: The (kind, checkpoint path, payload) writes to apply.
+        """
+        for (kind, checkpoint_path), group in groupby(writes, key=itemgetter(0, 1)):
+            payloads = [payload for _, _, payload in group]
+            if kind == _SNAPSHOT:
+                self._write_checkpoint(checkpoint_path, payloads[-1])
+                # The snapshot supersedes every journal frame
+                try:
+                    os.remove(self._journal_path(checkpoint_path))
+                except FileNotFoundError:
+                    pass
+            else:
+                self._append_journal(checkpoint_path, payloads)
+
+    def _append_journal(self, checkpoint_path: str, frames: list[bytes]) -> None:
+        """Append encoded frames to the journal next to a checkpoint.
+
+        The frames are handed to the kernel together with `os.writev`, so a
+        batch of queued turns costs one syscall and is never joined into an
+        intermediate buffer.
+
+        Args:
+            checkpoint_path: The path to the checkpoint file.
+            frames: The length-prefixed frames to append.
+        """
+        journal_path = self._journal_path(checkpoint_path)
+        self.logger.debug("Appending to checkpoint journal: %s", journal_path)
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
         try:
-            with open(checkpoint_path, "w", encoding="utf-8") as f:
-                json.dump(state_dict, f, ensure_ascii=False)
-            self.logger.debug(f"Saved checkpoint to: {checkpoint_path}")
+            try:
+                fd = os.open(journal_path, flags, 0o644)
+            except FileNotFoundError:
+                # The session directory was removed since it was created
+                os.makedirs(os.path.dirname(journal_path), exist_ok=True)
+                fd = os.open(journal_path, flags, 0o644)
+            try:
+                self._writev_all(fd, frames)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self.logger.error(f"Error appending to journal {journal_path}: {e}")
+            raise
+
+    def _write_checkpoint(self, checkpoint_path: str, payload: bytes) -> None:
+        """Atomically replace the checkpoint file with the encoded bytes.
+
+        The payload is written in one go to a temporary sibling file, synced
+        and renamed over the checkpoint, so a crash never leaves a torn file.
+
+        Args:
+            checkpoint_path: The path to the checkpoint file.
+            payload: The encoded checkpoint.
+        """
+        self.logger.debug("Saving checkpoint to: %s", checkpoint_path)
+        tmp_path = f"{checkpoint_path}.tmp"
+        try:
+            try:
+                f = open(tmp_path, "wb", buffering=0)
+            except FileNotFoundError:
+                # The session directory was removed since it was created
+                os.makedirs(os.path.dirname(tmp_path), exist_ok=True)
+                f = open(tmp_path, "wb", buffering=0)
+            with f:
+                self._write_all(f, payload)
+                os.fsync(f.fileno())
+            os.replace(tmp_path, checkpoint_path)
+            self.logger.debug("Saved checkpoint to: %s", checkpoint_path)
         except Exception as e:
             self.logger.error(f"Error saving checkpoint to {checkpoint_path}: {e}")
             raise
 
+    def _checkpoint_path(self, session_id: str) -> str:
+        """Return the default checkpoint path for a session."""
+        return os.path.join(self._checkpoints_root, session_id, CHECKPOINT_FILENAME)
+
+    @staticmethod
+    def _write_all(f, payload: bytes) -> None:
+        """Write the whole payload to an unbuffered file."""
+        view = memoryview(payload)
+        while view:
+            view = view[f.write(view) :]
+
+    @staticmethod
+    @contextmanager
+    def _read_buffer(path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+        """Yield the contents of a file for decoding.
+
+        Files of `MMAP_THRESHOLD` bytes or more are memory-mapped, so the
+        decoder reads the page cache directly instead of a copy. Smaller ones
+        are read with raw fd reads sized from `fstat`, which skips the
+        buffered file object and the extra read `f.read()` issues to find the
+        end of the file.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            remaining = os.fstat(fd).st_size
+            if remaining >= MMAP_THRESHOLD:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    yield mapped
+                return
+            chunks = []
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        finally:
+            os.close(fd)
+        yield chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    @staticmethod
+    def _writev_all(fd: int, buffers: list[bytes]) -> None:
+        """Write all buffers to a file descriptor, in order."""
+        if not hasattr(os, "writev"):
+            # Windows has no writev
+            with open(fd, "wb", buffering=0, closefd=False) as f:
+                StateCheckpointManager._write_all(f, b"".join(buffers))
+            return
+
+        views = [memoryview(buffer) for buffer in buffers if buffer]
+        while views:
+            written = os.writev(fd, views[:_IOV_MAX])
+            # Drop what was written, possibly ending inside a buffer
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if written:
+                views[0] = views[0][written:]
+
+    @staticmethod
+    def _journal_path(checkpoint_path: str) -> str:
+        """Return the journal path that belongs to a checkpoint file."""
+        return os.path.join(os.path.dirname(checkpoint_path), JOURNAL_FILENAME)
+
+    def _read_checkpoint(self, session_id: str, path: str) -> dict:
+        """Read the latest snapshot of a session and replay its journal.
+
+        Frames whose turn is already covered by the snapshot are skipped, so
+        a crash between writing a snapshot and removing the journal is safe.
+
+        Args:
+            session_id: The session the checkpoint belongs to.
+            path: The path to the checkpoint file.
+
+        Returns:
+            The raw (not yet validated) state dict.
+        """
+        state_dict = self._read_state_dict(path)
+        turn = state_dict.pop("checkpoint_turn", 0)
+        frames, complete = self._read_journal(self._journal_path(path))
+
+        entries = 0
+        for frame in frames:
+            frame_turn = frame.pop("checkpoint_turn")
+            if frame_turn <= turn:
+                continue
+            offset = frame.pop("message_offset")
+            messages = frame.pop("messages")
+            state_dict["messages"] = state_dict.get("messages", [])[:offset] + messages
+            state_dict.update(frame)
+            turn = frame_turn
+            entries += 1
+
+        self._journals[session_id] = {
+            "turn": turn,
+            "messages": len(state_dict.get("messages", [])),
+            # A torn trailing frame forces a full snapshot on the next save
+            "entries": entries if complete else SNAPSHOT_INTERVAL,
+            "digest": None,
+        }
+        return state_dict
+
+    @staticmethod
+    def _compress(payload: bytes) -> bytes:
+        """Compress an encoded checkpoint payload if it is large enough.
+
+        Args:
+            payload: The MessagePack-encoded snapshot or journal frame.
+
+        Returns:
+            The zstd frame, or the payload unchanged below the threshold.
+        """
+        if len(payload) < COMPRESSION_THRESHOLD:
+            return payload
+        return zstandard.compress(payload, COMPRESSION_LEVEL)
+
+    @staticmethod
+    def _decode_payload(data) -> dict:
+        """Decode a snapshot or journal frame, decompressing it if needed.
+
+        Args:
+            data: The stored payload as a bytes-like object.
+
+        Returns:
+            The decoded dict.
+        """
+        if data[: len(_ZSTD_MAGIC)] == _ZSTD_MAGIC:
+            data = zstandard.decompress(data)
+        return _CHECKPOINT_DECODER.decode(data)
+
+    @staticmethod
+    def _read_journal(journal_path: str) -> tuple[list[dict], bool]:
+        """Decode the frames of a checkpoint journal.
+
+        Args:
+            journal_path: The path to the journal file.
+
+        Returns:
+            The decoded frames and whether the journal ended on a frame boundary.
+        """
+        frames = []
+        pos = 0
+        try:
+            # Frame slices must be released before a memory map is closed
+            with StateCheckpointManager._read_buffer(
+                journal_path
+            ) as contents, memoryview(contents) as data:
+                while pos + _FRAME_HEADER.size <= len(data):
+                    (size,) = _FRAME_HEADER.unpack_from(data, pos)
+                    start = pos + _FRAME_HEADER.size
+                    if start + size > len(data):
+                        break
+                    with data[start : start + size] as frame:
+                        frames.append(StateCheckpointManager._decode_payload(frame))
+                    pos = start + size
+                complete = pos == len(data)
+        except FileNotFoundError:
+            return [], True
+        return frames, complete
+
+    def _read_state_dict(self, path: str) -> dict:
+        """Read a raw state dict from a MessagePack checkpoint.
+
+        Args:
+            path: The path to the MessagePack checkpoint file.
+
+        Returns:
+            The raw (not yet validated) state dict.
+        """
+        with self._read_buffer(path) as contents:
+            return self._decode_payload(contents)
+
     @staticmethod
     def _serialize_messages(messages: list[BaseMessage]) -> list[dict]:
         """Convert LangChain messages to a simple JSON format.
@@ -173,16 +675,26 @@ class StateCheckpointManager:
         """
         return [
             {
-                "type": (
-                    "human"
-                    if isinstance(msg, HumanMessage)
-                    else "ai" if isinstance(msg, AIMessage) else "system"
-                ),
+                "type": _MSG_TYPE_NAMES.get(type(msg))
+                or StateCheckpointManager._message_type_name(msg),
                 "content": msg.content,
             }
             for msg in messages
         ]
 
+    @staticmethod
+    def _message_type_name(msg: BaseMessage) -> str:
+        """Return the stored type of a message class missing from the table.
+
+        Covers subclasses such as `AIMessageChunk`; anything else is stored
+        as a system message.
+        """
+        if isinstance(msg, HumanMessage):
+            return "human"
+        if isinstance(msg, AIMessage):
+            return "ai"
+        return "system"
+
     @staticmethod
     def _deserialize_messages(messages_data: list[dict]) -> list[AnyMessage]:
         """Convert JSON format back to LangChain messages.
@@ -193,11 +705,4 @@ class StateCheckpointManager:
         Returns:
             The deserialized messages.
         """
-        message_types = {
-            "human": HumanMessage,
-            "ai": AIMessage,
-            "system": SystemMessage,
-        }
-        return [
-            message_types[msg["type"]](content=msg["content"]) for msg in messages_data
-        ]
+        return [_MSG_TYPES[msg["type"]](content=msg["content"]) for msg in messages_data]
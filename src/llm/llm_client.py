@@ -1,5 +1,7 @@
 """LLM client singleton accessor."""
 
+import threading
+
 from src.llm.llm_factory import LLMClientFactory
 from src.settings import custom_logger
 from src.structs.llm_clients import LLMClient
@@ -11,18 +13,35 @@ class LLMClientSingleton:
     """Provide a cached singleton LLM client instance."""
 
     _instance = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_client(cls):
-        """Return the cached client or create it once."""
+        """Return the cached client or create it once.
+
+        Creation is guarded by a lock so concurrent first callers share one
+        client.
+        """
         if cls._instance is None:
-            cls._instance = LLMClientFactory(LLMClient.OPENAI).get_client()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = LLMClientFactory(LLMClient.OPENAI).get_client()
+                    logger.info(f"LLM client initialized: {cls._instance}")
         return cls._instance
 
 
-try:
-    llm_client = LLMClientSingleton.get_client()
-    logger.info(f"LLM client initialized: {llm_client}")
-except Exception as e:  # pragma: no cover - environment dependent
-    logger.warning(f"LLM client unavailable during import: {e}")
-    llm_client = None
+class _LazyLLMClient:
+    """Stand-in that creates the singleton client on first attribute access.
+
+    Keeps importing the agents cheap and free of environment checks; a
+    missing configuration surfaces on the first LLM call instead.
+    """
+
+    def __getattr__(self, name):
+        return getattr(LLMClientSingleton.get_client(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy {LLMClientSingleton.__name__} client>"
+
+
+llm_client = _LazyLLMClient()
@@ -8,15 +8,15 @@ from langchain_openai import ChatOpenAI
 from src.settings import custom_logger
 from src.structs.llm_clients import LLMClient
 
+# Environment variables per backend, in the order of ``_CONFIG_FIELDS``.
 LLM_CLIENTS_REQ_CONFIG = {
-    LLMClient.GROQ: {
-        "GROQ_MODEL",
-        "GROQ_API_KEY",
-    },
-    LLMClient.OPENAI: {
-        "OPENAI_MODEL",
-        "OPENAI_API_KEY",
-    },
+    LLMClient.GROQ: ("GROQ_MODEL", "GROQ_API_KEY"),
+    LLMClient.OPENAI: ("OPENAI_MODEL", "OPENAI_API_KEY"),
+}
+_CONFIG_FIELDS = ("model_name", "api_key")
+_CLIENT_CLASSES = {
+    LLMClient.GROQ: ChatGroq,
+    LLMClient.OPENAI: ChatOpenAI,
 }
 
 
@@ -30,9 +30,14 @@ class LLMClientFactory:
         self.config = self._get_config()
 
     def _get_config(self):
-        required_vars = LLM_CLIENTS_REQ_CONFIG[self.client]
-        missing_vars = [var for var in required_vars if os.getenv(var) is None]
+        required_vars = LLM_CLIENTS_REQ_CONFIG.get(self.client)
+        if required_vars is None:
+            raise ValueError(f"Executor not defined: {self.client}")
 
+        values = [os.getenv(var) for var in required_vars]
+        missing_vars = [
+            var for var, value in zip(required_vars, values) if value is None
+        ]
         if missing_vars:
             self.logger.error(
                 f"Missing required environment variables: {', '.join(missing_vars)}"
@@ -41,26 +46,8 @@ class LLMClientFactory:
                 f"Missing required environment variables: {', '.join(missing_vars)}"
             )
 
-        if self.client == LLMClient.GROQ:
-            config_dict = {
-                "model_name": os.getenv("GROQ_MODEL"),
-                "api_key": os.getenv("GROQ_API_KEY"),
-            }
-        elif self.client == LLMClient.OPENAI:
-            config_dict = {
-                "model_name": os.getenv("OPENAI_MODEL"),
-                "api_key": os.getenv("OPENAI_API_KEY"),
-            }
-        else:
-            raise ValueError(f"Executor not defined: {self.client}")
-
-        return config_dict
+        return dict(zip(_CONFIG_FIELDS, values))
 
     def get_client(self) -> ChatGroq | ChatOpenAI:
         """Get the LLM client."""
-        if self.client == LLMClient.GROQ:
-            return ChatGroq(**self.config)
-        elif self.client == LLMClient.OPENAI:
-            return ChatOpenAI(**self.config)
-        else:
-            raise ValueError(f"Invalid client: {self.client}")
+        return _CLIENT_CLASSES[self.client](**self.config)
@@ -4,7 +4,11 @@ from src.prompts.asset_transferring_agent import (  # noqa: F401
     ASSET_TRANSFER_SYSTEM_PROMPT,
     ASSET_TRANSFER_USER_PROMPT,
 )
-from src.prompts.codex_fallback_agent import CODEX_FALLBACK_SYSTEM_PROMPT  # noqa: F401
+from src.prompts.chat_templates import get_chat_prompt  # noqa: F401
+from src.prompts.codex_fallback_agent import (  # noqa: F401
+    get_codex_fallback_context,
+    get_codex_fallback_prompt,
+)
 from src.prompts.layout_editing_agent import (  # noqa: F401
     LAYOUT_EDIT_SYSTEM_PROMPT,
     LAYOUT_EDIT_USER_PROMPT,
@@ -31,6 +35,9 @@ from src.prompts.web_splitting_agent import (  # noqa: F401
 )
 
 __all__ = [
+    "get_chat_prompt",
+    "ASSET_TRANSFER_SYSTEM_PROMPT",
+    "ASSET_TRANSFER_USER_PROMPT",
     "ORCHESTRATOR_PLANNING_PROMPT",
     "ORCHESTRATOR_SYSTEM_PROMPT",
     "TEXT_EDIT_SYSTEM_PROMPT",
@@ -43,5 +50,6 @@ __all__ = [
     "WEB_MERGE_USER_PROMPT",
     "WEB_SPLIT_SYSTEM_PROMPT",
     "WEB_SPLIT_USER_PROMPT",
-    "CODEX_FALLBACK_SYSTEM_PROMPT",
+    "get_codex_fallback_prompt",
+    "get_codex_fallback_context",
 ]
@@ -0,0 +1,28 @@
+"""Cached chat prompt templates built from the prompt strings."""
+
+from functools import lru_cache
+
+from langchain_core.prompts import ChatPromptTemplate
+
+
+@lru_cache(maxsize=32)
+def get_chat_prompt(system_prompt: str, user_prompt: str) -> ChatPromptTemplate:
+    """Return the system/user chat template for a pair of prompt strings.
+
+    Building a template parses both (multi-KB) prompt strings for their
+    variables, so each pair is built once and shared; formatting never
+    mutates the template.
+
+    Args:
+        system_prompt: The system prompt template.
+        user_prompt: The user prompt template.
+
+    Returns:
+        The chat prompt template.
+    """
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", system_prompt),
+            ("user", user_prompt),
+        ]
+    )
@@ -1,7 +1,6 @@
 """Asynchronous file and HTML utilities for ADT processing."""
 
 import asyncio
-import json
 import os
 import re
 import shutil
@@ -9,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import aiofiles
+import orjson
 from bs4 import BeautifulSoup, Tag
 
 from src.settings import (
@@ -82,10 +82,10 @@ async def write_html_file(file_path: str, content: str) -> None:
 
 async def read_translation_file(translation_file_path: str) -> dict:
     """Read and parse a translation JSON file asynchronously."""
-    async with aiofiles.open(translation_file_path, "r", encoding="utf-8") as file:
+    async with aiofiles.open(translation_file_path, "rb") as file:
         contents = await file.read()
-        translation_data = json.loads(contents)
-    return translation_data
+    # orjson parses the UTF-8 bytes directly, without decoding to str first
+    return orjson.loads(contents)
 
 
 def extract_translated_mappings_sync(
@@ -330,15 +330,18 @@ async def find_and_duplicate_nav_line(
     Returns:
         The new nav line with updated href
     """
-    # Find the line containing the original href
-    lines = nav_content.split("\n")
-    for line in lines:
-        if f'href="{original_href}"' in line:
-            # Create new line by replacing the href
-            new_line = line.replace(f'href="{original_href}"', f'href="{new_href}"')
-            return new_line
+    # Locate the href and slice out its line instead of splitting the whole nav
+    href = f'href="{original_href}"'
+    pos = nav_content.find(href)
+    if pos == -1:
+        raise ValueError(f"Could not find nav item with href='{original_href}'")
+
+    start = nav_content.rfind("\n", 0, pos) + 1
+    end = nav_content.find("\n", pos)
+    line = nav_content[start:] if end == -1 else nav_content[start:end]
 
-    raise ValueError(f"Could not find nav item with href='{original_href}'")
+    # Create new line by replacing the href
+    return line.replace(href, f'href="{new_href}"')
 
 
 async def write_nav_line(nav_content: str, nav_line: str) -> str:
@@ -514,15 +517,9 @@ async def extract_and_save_html_contents(language: str) -> str:
         # Ensure the directory exists
         await asyncio.to_thread(os.makedirs, os.path.dirname(save_path), exist_ok=True)
 
-        # Write JSON asynchronously
-        await asyncio.to_thread(
-            lambda: json.dump(
-                available_html_files,
-                open(save_path, "w", encoding="utf-8"),
-                ensure_ascii=False,
-                indent=2,
-            )
-        )
+        # Write JSON asynchronously (orjson emits UTF-8, like ensure_ascii=False)
+        payload = orjson.dumps(available_html_files, option=orjson.OPT_INDENT_2)
+        await asyncio.to_thread(Path(save_path).write_bytes, payload)
 
         logger.info(f"Saved translated HTML content to: {save_path}")
         return True
@@ -539,8 +536,8 @@ async def load_translated_html_contents(language: str):
     )
 
     def load_json():
-        with open(load_path, encoding="utf-8") as f:
-            return json.load(f)
+        with open(load_path, "rb") as f:
+            return orjson.loads(f.read())
 
     data = await asyncio.to_thread(load_json)
 
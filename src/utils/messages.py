@@ -35,3 +35,21 @@ def message_is_human(
     """
 
     return isinstance(message_type, HumanMessage) or isinstance(message_type, AIMessage)
+
+
+def classify_message(
+    message_type: Union[AIMessage, HumanMessage, SystemMessage],
+) -> tuple[bool, bool]:
+    """Classify a message for the chat response in a single pass.
+
+    Args:
+        message_type: The type of message to check.
+
+    Returns:
+        A tuple with the results of `message_is_agent` and `message_is_human`.
+    """
+    if isinstance(message_type, AIMessage):
+        return True, True
+    if isinstance(message_type, HumanMessage):
+        return False, True
+    return isinstance(message_type, SystemMessage), False
@@ -5,13 +5,14 @@ whitelist-based shell executor and a Codex-backed fallback for
 natural‑language instructions.
 """
 
+import asyncio
 import datetime
 import os
 import shlex
 import subprocess
 from typing import List, Optional
 
-from src.prompts import CODEX_FALLBACK_SYSTEM_PROMPT
+from src.prompts import get_codex_fallback_context
 from src.settings import (
     OUTPUT_DIR,
     TAILWIND_CSS_IN_DIR,
@@ -20,12 +21,14 @@ from src.settings import (
     settings,
 )
 from src.structs.terminal import CommandHistory, CommandResponse, ExecuteCommandRequest
-from src.utils import to_single_line
 from src.utils.command_sanitizer import sanitize_terminal_command
 
 # Initialize logger
 logger = custom_logger("Terminal Service")
 
+# Upper bound on commands (shell or Codex) running at the same time
+MAX_CONCURRENT_COMMANDS = 4
+
 
 class TerminalService:
     """Service that executes commands and maintains a simple history."""
@@ -49,12 +52,30 @@ class TerminalService:
             "pip",
             "clear",
         ]
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
 
     def is_command_allowed(self, command: str) -> bool:
         """Return True if the command's base program is in the allowlist."""
         base_command = command.split()[0]
         return base_command in self.allowed_commands
 
+    async def execute_command_async(
+        self, request: ExecuteCommandRequest
+    ) -> CommandResponse:
+        """Execute a command in a worker thread, off the event loop.
+
+        At most `MAX_CONCURRENT_COMMANDS` commands run at once; further
+        requests wait for a slot.
+
+        Args:
+            request: ExecuteCommandRequest with command, working_directory, and is_prompt flag
+
+        Returns:
+            CommandResponse with output, exit_code, and timestamp
+        """
+        async with self._semaphore:
+            return await asyncio.to_thread(self.execute_command, request)
+
     def execute_command(self, request: ExecuteCommandRequest) -> CommandResponse:
         """Execute a shell command or delegate to Codex based on mode.
 
@@ -151,7 +172,7 @@ class TerminalService:
         """Use Codex CLI to process natural‑language instructions."""
         working_dir = working_dir or os.getcwd()
         timestamp = datetime.datetime.now().isoformat()
-        context = to_single_line(CODEX_FALLBACK_SYSTEM_PROMPT)
+        context = get_codex_fallback_context()
 
         codex_cmd = [
             "codex",
@@ -8,7 +8,6 @@ from typing import Any
 
 from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.core.git_manager_provider import get_git_manager
@@ -17,6 +16,7 @@ from src.llm.llm_client import llm_client
 from src.prompts import (
     ORCHESTRATOR_PLANNING_PROMPT,
     ORCHESTRATOR_SYSTEM_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import (
     ADT_UTILS_DIR,
@@ -140,12 +140,7 @@ async def plan_steps(state: ADTState, config: RunnableConfig) -> ADTState:
         logger.info(f"The selected page is: {list(available_html_files.keys())}")
 
     # Format messages
-    messages = ChatPromptTemplate(
-        messages=[
-            ("system", ORCHESTRATOR_SYSTEM_PROMPT),
-            ("user", ORCHESTRATOR_PLANNING_PROMPT),
-        ]
-    )
+    messages = get_chat_prompt(ORCHESTRATOR_SYSTEM_PROMPT, ORCHESTRATOR_PLANNING_PROMPT)
 
     formatted_messages = await messages.ainvoke(
         {
@@ -319,12 +314,7 @@ async def handle_plan_response(state: ADTState, config: RunnableConfig) -> ADTSt
         logger.info(f"The selected page is: {list(available_html_files.keys())}")
 
     # Format messages
-    messages = ChatPromptTemplate(
-        messages=[
-            ("system", ORCHESTRATOR_SYSTEM_PROMPT),
-            ("user", ORCHESTRATOR_PLANNING_PROMPT),
-        ]
-    )
+    messages = get_chat_prompt(ORCHESTRATOR_SYSTEM_PROMPT, ORCHESTRATOR_PLANNING_PROMPT)
 
     formatted_messages = await messages.ainvoke(
         {
@@ -1,11 +1,11 @@
 from langchain_core.messages import AIMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.llm.llm_client import llm_client
 from src.prompts import (
     ASSET_TRANSFER_SYSTEM_PROMPT,
     ASSET_TRANSFER_USER_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import OUTPUT_DIR, custom_logger
 from src.structs.status import StepStatus
@@ -35,12 +35,7 @@ async def asset_transfer(state: ADTState, config: RunnableConfig) -> ADTState:
         The updated state of the workflow
     """
     # Create prompt
-    messages = ChatPromptTemplate.from_messages(
-        [
-            ("system", ASSET_TRANSFER_SYSTEM_PROMPT),
-            ("user", ASSET_TRANSFER_USER_PROMPT),
-        ]
-    )
+    messages = get_chat_prompt(ASSET_TRANSFER_SYSTEM_PROMPT, ASSET_TRANSFER_USER_PROMPT)
 
     # Define current state step
     current_step = state.steps[state.current_step_index]
@@ -3,7 +3,7 @@ import shlex
 import subprocess
 from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
-from src.prompts import CODEX_FALLBACK_SYSTEM_PROMPT
+from src.prompts import get_codex_fallback_context
 from src.settings import (
     OUTPUT_DIR,
     TAILWIND_CSS_IN_DIR,
@@ -29,7 +29,7 @@ async def fallback_agent(state: ADTState, config: RunnableConfig) -> ADTState:
 
     # command flags & contents
     working_dir = OUTPUT_DIR
-    context = to_single_line(CODEX_FALLBACK_SYSTEM_PROMPT)
+    context = get_codex_fallback_context()
     user_prompt = (
         to_single_line(current_step.step)
         .replace('"', "'")
@@ -1,11 +1,11 @@
 from langchain_core.messages import AIMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.llm.llm_client import llm_client
 from src.prompts import (
     LAYOUT_EDIT_SYSTEM_PROMPT,
     LAYOUT_EDIT_USER_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import (
     OUTPUT_DIR,
@@ -42,12 +42,7 @@ async def edit_layout(state: ADTState, config: RunnableConfig) -> ADTState:
         The updated state of the workflow
     """
     # Create prompt
-    messages = ChatPromptTemplate.from_messages(
-        [
-            ("system", LAYOUT_EDIT_SYSTEM_PROMPT),
-            ("user", LAYOUT_EDIT_USER_PROMPT),
-        ]
-    )
+    messages = get_chat_prompt(LAYOUT_EDIT_SYSTEM_PROMPT, LAYOUT_EDIT_USER_PROMPT)
 
     # Define current state step
     current_step = state.steps[state.current_step_index]
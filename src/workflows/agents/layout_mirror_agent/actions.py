@@ -1,11 +1,11 @@
 from langchain_core.messages import AIMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.llm.llm_client import llm_client
 from src.prompts import (
     LAYOUT_MIRRORING_SYSTEM_PROMPT,
     LAYOUT_MIRRORING_USER_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import custom_logger, OUTPUT_DIR
 from src.structs.status import StepStatus
@@ -39,11 +39,8 @@ async def mirror_layout(state: ADTState, config: RunnableConfig) -> ADTState:
     """
 
     # Create prompt
-    messages = ChatPromptTemplate.from_messages(
-        [
-            ("system", LAYOUT_MIRRORING_SYSTEM_PROMPT),
-            ("user", LAYOUT_MIRRORING_USER_PROMPT),
-        ]
+    messages = get_chat_prompt(
+        LAYOUT_MIRRORING_SYSTEM_PROMPT, LAYOUT_MIRRORING_USER_PROMPT
     )
 
     # Define current state step
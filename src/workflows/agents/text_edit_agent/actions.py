@@ -8,13 +8,13 @@ from typing import List
 
 from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.llm.llm_client import llm_client
 from src.prompts import (
     TEXT_EDIT_SYSTEM_PROMPT,
     TEXT_EDIT_USER_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import (
     ADT_UTILS_DIR,
@@ -51,12 +51,7 @@ async def detect_text_edits(state: ADTState, config: RunnableConfig) -> ADTState
         The updated state of the workflow
     """
     # Create prompt
-    messages = ChatPromptTemplate.from_messages(
-        [
-            ("system", TEXT_EDIT_SYSTEM_PROMPT),
-            ("user", TEXT_EDIT_USER_PROMPT),
-        ]
-    )
+    messages = get_chat_prompt(TEXT_EDIT_SYSTEM_PROMPT, TEXT_EDIT_USER_PROMPT)
 
     # Define current state step
     current_step = state.steps[state.current_step_index]
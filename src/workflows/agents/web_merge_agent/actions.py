@@ -1,11 +1,11 @@
 from langchain_core.messages import AIMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.llm.llm_client import llm_client
 from src.prompts import (
     WEB_MERGE_SYSTEM_PROMPT,
     WEB_MERGE_USER_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import (
     NAV_HTML_DIR,
@@ -36,12 +36,7 @@ async def web_merge(state: ADTState, config: RunnableConfig) -> ADTState:
     """Merge two or more webs based on the instruction while preserving HTML semantics and structure."""
 
     # Create prompt
-    messages = ChatPromptTemplate.from_messages(
-        [
-            ("system", WEB_MERGE_SYSTEM_PROMPT),
-            ("user", WEB_MERGE_USER_PROMPT),
-        ]
-    )
+    messages = get_chat_prompt(WEB_MERGE_SYSTEM_PROMPT, WEB_MERGE_USER_PROMPT)
 
     # Define current state step
     current_step = state.steps[state.current_step_index]
@@ -3,13 +3,13 @@ import json
 
 from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
 from src.llm.llm_client import llm_client
 from src.prompts import (
     WEB_SPLIT_SYSTEM_PROMPT,
     WEB_SPLIT_USER_PROMPT,
+    get_chat_prompt,
 )
 from src.settings import (
     NAV_HTML_DIR,
@@ -64,12 +64,7 @@ async def web_split(state: ADTState, config: RunnableConfig) -> ADTState:
     )
 
     # Step 1: Split HTML
-    split_prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", WEB_SPLIT_SYSTEM_PROMPT),
-            ("user", WEB_SPLIT_USER_PROMPT),
-        ]
-    )
+    split_prompt = get_chat_prompt(WEB_SPLIT_SYSTEM_PROMPT, WEB_SPLIT_USER_PROMPT)
     split_input = {
         "html_input": html_content,
         "translated_texts": translated_contents,
@@ -1,3 +1,4 @@
+import json
 import os
 import subprocess
 
@@ -20,6 +21,10 @@ class FakeGraph:
             "status": WorkflowStatus.SUCCESS,
         }
 
+    async def astream(self, state, stream_mode="values"):
+        yield {"messages": list(state.messages), "status": WorkflowStatus.IN_PROGRESS}
+        yield await self.ainvoke(state)
+
 
 @pytest.fixture
 def client(monkeypatch):
@@ -106,3 +111,31 @@ def test_adt_utils_run_script_success(monkeypatch, client):
     assert r.status_code == 200
     js = r.json()
     assert js["status"] == "success"
+
+
+def test_chat_edit_stream_flow(client):
+    payload = {
+        "session_id": "s2",
+        "user_message": "hello",
+        "language": "en",
+        "user_language": "en",
+        "pages": [],
+        "book_information": {"id": "b1", "version": "v1"},
+    }
+    r = client.post("/chat/edit/stream", json=payload)
+    assert r.status_code == 200
+    events = [json.loads(line) for line in r.text.splitlines()]
+    assert [e["event"] for e in events] == ["update", "update", "done"]
+    assert events[-1]["status"] == "success"
+    assert events[-1]["messages"][0]["content"] == "Plan acknowledged."
+
+
+def test_root_serves_cached_index_with_etag(client):
+    if not os.path.exists("frontend/index.html"):
+        pytest.skip("frontend not built")
+    r = client.get("/")
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+
+    r = client.get("/", headers={"If-None-Match": etag})
+    assert r.status_code == 304
@@ -1,7 +1,7 @@
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
-from src.utils.messages import message_is_agent, message_is_human
+from src.utils.messages import classify_message, message_is_agent, message_is_human
 
 
 def test_message_is_agent():
@@ -15,3 +15,15 @@ def test_message_is_human():
     assert message_is_human(AIMessage(content="bot")) is True
     assert message_is_human(SystemMessage(content="sys")) is False
 
+
+
+def test_classify_message_matches_single_checks():
+    for message in (
+        AIMessage(content="bot"),
+        HumanMessage(content="user"),
+        SystemMessage(content="sys"),
+    ):
+        assert classify_message(message) == (
+            message_is_agent(message),
+            message_is_human(message),
+        )
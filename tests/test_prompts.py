@@ -0,0 +1,10 @@
+from src.prompts import get_codex_fallback_context, get_codex_fallback_prompt
+from src.utils import to_single_line
+
+
+def test_codex_fallback_context_is_single_line_prompt():
+    context = get_codex_fallback_context()
+
+    assert context == to_single_line(get_codex_fallback_prompt())
+    assert context is get_codex_fallback_context()
+    assert "## Critical Checks" in context
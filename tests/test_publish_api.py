@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -25,7 +27,7 @@ class FakeGitManager:
     ):
         return self.commits
 
-    async def safe_push(self, branch_name: str):
+    async def safe_push(self, branch_name: str, current_branch=None):
         return None
 
     async def tag_last_published_commit(self, tag_name: str = "last_published"):
@@ -35,7 +37,7 @@ class FakeGitManager:
         return False
 
     async def create_pull_request(
-        self, title: str, body: str = "", base: str = "main"
+        self, title: str, body: str = "", base: str = "main", head=None
     ) -> str:
         return "https://github.com/org/repo/pull/1"
 
@@ -76,3 +78,48 @@ def test_publish_commits_list(client):
     r = client.get("/publish/commits")
     assert r.status_code == 200
     assert isinstance(r.json(), list)
+
+
+def test_failed_push_does_not_move_published_tag():
+    class FailingPushManager(FakeGitManager):
+        tagged = False
+
+        async def safe_push(self, branch_name: str, current_branch=None):
+            raise RuntimeError("push rejected")
+
+        async def tag_last_published_commit(self, tag_name: str = "last_published"):
+            self.tagged = True
+
+    manager = FailingPushManager()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            publish_mod._push_tag_and_pr(manager, "feature/test", "feature/test", "m")
+        )
+
+    assert not manager.tagged
+
+
+def test_failed_pr_check_still_completes_push_and_tag():
+    class FailingCheckManager(FakeGitManager):
+        pushed = tagged = False
+
+        async def safe_push(self, branch_name: str, current_branch=None):
+            await asyncio.sleep(0.01)
+            self.pushed = True
+
+        async def tag_last_published_commit(self, tag_name: str = "last_published"):
+            self.tagged = True
+
+        async def pull_request_exists(self, branch_name: str) -> bool:
+            raise RuntimeError("GitHub unavailable")
+
+    manager = FailingCheckManager()
+
+    with pytest.raises(RuntimeError, match="GitHub unavailable"):
+        asyncio.run(
+            publish_mod._push_tag_and_pr(manager, "feature/test", "feature/test", "m")
+        )
+
+    assert manager.pushed
+    assert manager.tagged
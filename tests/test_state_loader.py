@@ -1,6 +1,37 @@
+import asyncio
+import shutil
+
+import pytest
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
+from src.core import state_loader
 from src.core.state_loader import StateCheckpointManager
+from src.structs import ChatEditRequest, TailwindStatus, UserLanguage
+from src.structs.planning import PlanningStep
+
+
+def make_request(**kwargs) -> ChatEditRequest:
+    # Follow-up turn "next" for session s1; override any field per test
+    fields = {
+        "session_id": "s1",
+        "user_message": "next",
+        "language": "en",
+        "user_language": "en",
+        "pages": [],
+        "book_information": {"id": "book", "version": "v1"},
+    }
+    fields.update(kwargs)
+    return ChatEditRequest(**fields)
+
+
+def make_output(messages, **fields) -> dict:
+    # Minimal workflow output as the graph returns it
+    return {
+        "messages": messages,
+        "user_query": [HumanMessage(content="hello")],
+        "session_id": "s1",
+        **fields,
+    }
 
 
 def test_serialize_deserialize_messages_roundtrip():
@@ -22,3 +53,179 @@ def test_serialize_deserialize_messages_roundtrip():
     assert restored[1].content == "bot"
     assert restored[2].content == "sys"
 
+
+@pytest.mark.parametrize("mmap_threshold", [1024 * 1024, 1])
+def test_checkpoint_journal_replays_appended_turns(
+    tmp_path, monkeypatch, mmap_threshold
+):
+    # A threshold of 1 byte reads every file through a memory map
+    monkeypatch.setattr(state_loader, "MMAP_THRESHOLD", mmap_threshold)
+    mgr = StateCheckpointManager()
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request()
+
+    messages = [HumanMessage(content="hello")]
+    for turn in range(3):
+        messages = messages + [AIMessage(content=f"reply {turn}")]
+        mgr.save_state_checkpoint(
+            request, make_output(messages), path=checkpoint_path
+        )
+
+    # Only the first save writes a snapshot, later turns go to the journal
+    assert (tmp_path / "checkpoint.journal").exists()
+
+    state = StateCheckpointManager().load_state_checkpoint(request, checkpoint_path)
+
+    assert [m.content for m in state.messages] == [
+        "hello",
+        "reply 0",
+        "reply 1",
+        "reply 2",
+        "next",
+    ]
+
+
+def test_unchanged_checkpoint_is_not_rewritten(tmp_path):
+    mgr = StateCheckpointManager()
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request()
+
+    def output():
+        return make_output([HumanMessage(content="hello"), AIMessage(content="hi")])
+
+    mgr.save_state_checkpoint(request, output(), path=checkpoint_path)
+    mgr.save_state_checkpoint(request, output(), path=checkpoint_path)
+
+    assert not (tmp_path / "checkpoint.journal").exists()
+
+
+def test_checkpoint_journal_replays_changed_fields(tmp_path):
+    mgr = StateCheckpointManager()
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request(language="")
+
+    messages = [HumanMessage(content="hello")]
+    for turn, language in enumerate(["es", "es", "fr", "fr"]):
+        messages = messages + [AIMessage(content=f"reply {turn}")]
+        mgr.save_state_checkpoint(
+            request, make_output(messages, language=language), path=checkpoint_path
+        )
+
+    state = StateCheckpointManager().load_state_checkpoint(request, checkpoint_path)
+
+    assert state.language == "fr"
+    assert len(state.messages) == 6
+
+
+def test_async_checkpoint_roundtrip(tmp_path):
+    mgr = StateCheckpointManager()
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request()
+    output = make_output([HumanMessage(content="hello"), AIMessage(content="hi")])
+
+    async def roundtrip():
+        await mgr.asave_state_checkpoint(request, output, path=checkpoint_path)
+        return await mgr.aload_state_checkpoint(request, checkpoint_path)
+
+    state = asyncio.run(roundtrip())
+
+    assert [m.content for m in state.messages] == ["hello", "hi", "next"]
+
+
+def test_enqueued_checkpoints_are_written_on_flush(tmp_path):
+    mgr = StateCheckpointManager()
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request()
+
+    async def enqueue_turns():
+        messages = [HumanMessage(content="hello")]
+        for turn in range(3):
+            messages = messages + [AIMessage(content=f"reply {turn}")]
+            mgr.enqueue_state_checkpoint(
+                request, make_output(messages), path=checkpoint_path
+            )
+        await mgr.flush("s1")
+
+    asyncio.run(enqueue_turns())
+    state = StateCheckpointManager().load_state_checkpoint(request, checkpoint_path)
+
+    assert [m.content for m in state.messages][-2:] == ["reply 2", "next"]
+    assert len(state.messages) == 5
+
+
+def test_large_checkpoint_is_compressed(tmp_path):
+    mgr = StateCheckpointManager()
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request()
+    page = "<section><p>Once upon a time</p></section>" * 2000
+
+    messages = [HumanMessage(content="hello")]
+    for turn in range(2):
+        messages = messages + [AIMessage(content=f"{page} {turn}")]
+        mgr.save_state_checkpoint(
+            request, make_output(messages), path=checkpoint_path
+        )
+
+    snapshot = (tmp_path / "checkpoint.msgpack").read_bytes()
+    assert snapshot.startswith(state_loader._ZSTD_MAGIC)
+    assert len(snapshot) < len(page) // 10
+
+    state = StateCheckpointManager().load_state_checkpoint(request, checkpoint_path)
+
+    assert [m.content for m in state.messages] == [
+        "hello",
+        f"{page} 0",
+        f"{page} 1",
+        "next",
+    ]
+
+
+@pytest.mark.parametrize("validate_on_load", [False, True])
+def test_loaded_checkpoint_restores_typed_fields(tmp_path, validate_on_load):
+    checkpoint_path = str(tmp_path / "checkpoint.msgpack")
+    request = make_request(language="", user_language="")
+    step = PlanningStep(
+        step="Edit text",
+        non_technical_description="Fix a typo",
+        agent="text_edit_agent",
+        html_files=["page.html"],
+        layout_template_files=[],
+    )
+    output = make_output(
+        [HumanMessage(content="hello")],
+        steps=[step],
+        tailwind_status=TailwindStatus.INSTALLED,
+        user_language=UserLanguage.es,
+    )
+    mgr = StateCheckpointManager()
+    mgr.save_state_checkpoint(request, output, path=checkpoint_path)
+
+    state = StateCheckpointManager(
+        validate_on_load=validate_on_load
+    ).load_state_checkpoint(request, checkpoint_path)
+
+    assert state.steps == [step]
+    assert state.tailwind_status is TailwindStatus.INSTALLED
+    assert state.user_language is UserLanguage.es
+    assert state.completed_steps == []
+    assert [m.content for m in state.messages] == ["hello", "next"]
+
+
+def test_checkpoint_is_written_after_session_dir_is_removed(tmp_path):
+    mgr = StateCheckpointManager()
+    session_dir = tmp_path / "s1"
+    checkpoint_path = str(session_dir / "checkpoint.msgpack")
+    request = make_request()
+    messages = [HumanMessage(content="hello"), AIMessage(content="hi")]
+
+    mgr.create_new_state_checkpoint(request, str(session_dir))
+    mgr.save_state_checkpoint(request, make_output(messages), path=checkpoint_path)
+    shutil.rmtree(session_dir)
+    # A fresh session after the wipe still gets its directory back
+    mgr.create_new_state_checkpoint(request, str(session_dir))
+    shutil.rmtree(session_dir)
+    mgr.save_state_checkpoint(request, make_output(messages), path=checkpoint_path)
+
+    state = StateCheckpointManager().load_state_checkpoint(request, checkpoint_path)
+
+    assert [m.content for m in state.messages] == ["hello", "hi", "next"]